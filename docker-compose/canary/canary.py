@@ -9,6 +9,7 @@ import random
 import time
 import requests
 from datetime import datetime
+from itertools import accumulate
 
 
 TRAVEL_PLANNER_URL = os.getenv("TRAVEL_PLANNER_URL", "http://travel-planner:8000")
@@ -39,12 +40,13 @@ FAULT_CONFIGS = {
     "partial_failure": {"orchestrator": "partial_failure"},
 }
 
+# Weights are fixed for the lifetime of the process, so resolve them once
+FAULT_CHOICES = [(name, FAULT_CONFIGS.get(name)) for name in FAULT_WEIGHTS]
+FAULT_CUM_WEIGHTS = list(accumulate(FAULT_WEIGHTS.values()))
+
 
 def select_fault():
-    fault_types = list(FAULT_WEIGHTS.keys())
-    weights = list(FAULT_WEIGHTS.values())
-    selected = random.choices(fault_types, weights=weights, k=1)[0]
-    return selected, FAULT_CONFIGS.get(selected)
+    return random.choices(FAULT_CHOICES, cum_weights=FAULT_CUM_WEIGHTS, k=1)[0]
 
 
 def check_health():
@@ -68,9 +70,9 @@ def invoke_planner(destination: str, fault_name: str, fault_config: dict):
         print(f"[{timestamp}] {destination} (fault: {fault_name})")
 
         response = requests.post(f"{TRAVEL_PLANNER_URL}/plan", json=payload, timeout=60)
-        data = response.json()
 
         if response.status_code == 200:
+            data = response.json()
             status = "partial" if data.get("partial") else "ok"
             events_count = len(data.get("events", []))
             print(f"         → {status}, {events_count} events")
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
+import glob
+import json
 import os
 import time
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "http://opensearch-dashboards:5601"
 USERNAME = os.getenv("OPENSEARCH_USER", "admin")
@@ -11,12 +15,36 @@ PASSWORD = os.getenv("OPENSEARCH_PASSWORD", "admin")
 PROMETHEUS_HOST = os.getenv("PROMETHEUS_HOST", "prometheus")
 PROMETHEUS_PORT = os.getenv("PROMETHEUS_PORT", "9090")
 
+# Shared session so API calls reuse keep-alive connections and credentials
+session = requests.Session()
+session.auth = (USERNAME, PASSWORD)
+# Retry transient gateway errors on read-only lookups; creates are POSTs
+# without client-chosen ids, so retrying them could duplicate objects
+session.mount(
+    "http://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+    ),
+)
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def wait_for_dashboards():
     """Wait for OpenSearch Dashboards to be ready"""
     print("🔄 Initializing OpenSearch workspace...")
 
+    # Poll quickly at first, backing off to the previous fixed 5s interval
+    delay = 0.5
     while True:
         try:
+            # Bypass the retrying session so each probe is a single attempt
             response = requests.get(
                 f"{BASE_URL}/api/status", auth=(USERNAME, PASSWORD), timeout=5
             )
@@ -26,14 +54,14 @@ def wait_for_dashboards():
             pass
 
         print("⏳ Waiting for OpenSearch Dashboards...")
-        time.sleep(5)
+        time.sleep(delay)
+        delay = min(delay * 2, 5)
 
 def get_existing_workspace():
     """Check if Observability Stack workspace already exists"""
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/workspaces/_list",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json={},
             verify=False,
@@ -67,9 +95,8 @@ def create_workspace():
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/workspaces",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -104,9 +131,8 @@ def get_existing_index_pattern(workspace_id, title):
         else:
             url = f"{BASE_URL}/api/saved_objects/_find?type=index-pattern&search_fields=title&search={title}"
 
-        response = requests.get(
+        response = session.get(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             verify=False,
             timeout=10,
@@ -159,9 +185,8 @@ def create_index_pattern(
         url = f"{BASE_URL}/api/saved_objects/index-pattern"
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -184,9 +209,8 @@ def create_index_pattern(
 def get_existing_prometheus_datasource(datasource_name):
     """Check if a Prometheus datasource with the given name already exists"""
     try:
-        response = requests.get(
+        response = session.get(
             f"{BASE_URL}/api/saved_objects/_find?per_page=10000&type=data-connection",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             verify=False,
             timeout=10,
@@ -238,9 +262,8 @@ def create_prometheus_datasource(workspace_id):
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/directquery/dataconnections",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -289,9 +312,8 @@ def associate_prometheus_with_workspace(workspace_id, datasource_id):
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/workspaces/_associate",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -318,9 +340,8 @@ def associate_datasource_with_workspace(workspace_id, datasource_id):
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/workspaces/_associate",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -340,9 +361,8 @@ def associate_datasource_with_workspace(workspace_id, datasource_id):
 def get_existing_opensearch_datasource(datasource_title):
     """Check if OpenSearch datasource already exists"""
     try:
-        response = requests.get(
+        response = session.get(
             f"{BASE_URL}/api/saved_objects/_find?per_page=10000&type=data-source",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             verify=False,
             timeout=10,
@@ -393,9 +413,8 @@ def create_opensearch_datasource(workspace_id):
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/saved_objects/data-source",
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -435,9 +454,8 @@ def set_default_index_pattern(workspace_id, pattern_id):
     payload = {"value": pattern_id}
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -462,9 +480,8 @@ def get_existing_correlation(workspace_id, correlation_type_prefix):
         else:
             url = f"{BASE_URL}/api/saved_objects/_find?type=correlations"
 
-        response = requests.get(
+        response = session.get(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             verify=False,
             timeout=10,
@@ -512,9 +529,8 @@ def create_correlation(workspace_id, correlation_type, title, entities, referenc
         url = f"{BASE_URL}/api/saved_objects/correlations"
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -599,9 +615,8 @@ def create_or_update_saved_query(
         if workspace_id and workspace_id != "default":
             create_payload["workspaces"] = [workspace_id]
 
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=create_payload,
             verify=False,
@@ -616,9 +631,8 @@ def create_or_update_saved_query(
             print(f"🔄 Query exists, updating: {title}")
             update_payload = {"attributes": base_attributes}
 
-            response = requests.put(
+            response = session.put(
                 url,
-                auth=(USERNAME, PASSWORD),
                 headers={"Content-Type": "application/json", "osd-xsrf": "true"},
                 json=update_payload,
                 verify=False,
@@ -643,8 +657,6 @@ def create_default_saved_queries(workspace_id):
     """Create a collection of useful saved queries for agent observability"""
     print("📝 Creating saved queries...")
 
-    import glob
-
     # Load all saved-queries-*.yaml files
     queries_files = glob.glob("/config/saved-queries-*.yaml")
 
@@ -656,8 +668,8 @@ def create_default_saved_queries(workspace_id):
     for queries_file in sorted(queries_files):
         print(f"📄 Loading {os.path.basename(queries_file)}...")
         try:
-            with open(queries_file, "r") as f:
-                config = yaml.safe_load(f)
+            with open(queries_file, "rb") as f:
+                config = yaml.load(f, Loader=YAML_LOADER)
                 queries = config.get("queries", [])
         except yaml.YAMLError as e:
             print(f"⚠️  Error parsing {queries_file}: {e}")
@@ -691,9 +703,8 @@ def get_existing_dashboard(workspace_id, dashboard_id):
         else:
             url = f"{BASE_URL}/api/saved_objects/dashboard/{dashboard_id}"
 
-        response = requests.get(
+        response = session.get(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"osd-xsrf": "true"},
             verify=False,
             timeout=10,
@@ -715,9 +726,8 @@ def set_default_dashboard(workspace_id, dashboard_id):
     payload = {"changes": {"observability:defaultDashboard": dashboard_id}}
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -734,8 +744,6 @@ def set_default_dashboard(workspace_id, dashboard_id):
 
 def create_agent_observability_dashboard(workspace_id, traces_pattern_id):
     """Create or update Agent Observability dashboard with visualizations"""
-    import json
-
     dashboard_id = "agent-observability-dashboard"
     dashboard_exists = get_existing_dashboard(workspace_id, dashboard_id)
 
@@ -833,9 +841,8 @@ def create_agent_observability_dashboard(workspace_id, traces_pattern_id):
         payload["workspaces"] = [workspace_id]
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -850,9 +857,8 @@ def create_agent_observability_dashboard(workspace_id, traces_pattern_id):
             # Dashboard exists, update it with PUT
             print("🔄 Dashboard exists, updating...")
             update_payload = {"attributes": payload["attributes"], "references": references}
-            response = requests.put(
+            response = session.put(
                 url,
-                auth=(USERNAME, PASSWORD),
                 headers={"Content-Type": "application/json", "osd-xsrf": "true"},
                 json=update_payload,
                 verify=False,
@@ -876,8 +882,6 @@ def create_agent_observability_dashboard(workspace_id, traces_pattern_id):
 def create_chart_visualization(workspace_id, vis_id, title, vis_type, field, index_pattern_id,
                                 metric_field=None, split_field=None):
     """Create a chart visualization (pie, bar, etc.)"""
-    import json
-
     if workspace_id and workspace_id != "default":
         url = f"{BASE_URL}/w/{workspace_id}/api/saved_objects/visualization/{vis_id}"
     else:
@@ -928,9 +932,8 @@ def create_chart_visualization(workspace_id, vis_id, title, vis_type, field, ind
         payload["workspaces"] = [workspace_id]
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            auth=(USERNAME, PASSWORD),
             headers={"Content-Type": "application/json", "osd-xsrf": "true"},
             json=payload,
             verify=False,
@@ -4,10 +4,10 @@ Events Agent - Fetches local events for a destination.
 Supports fault injection for testing observability.
 """
 
+import asyncio
 import json
 import os
 import random
-import time
 from datetime import datetime
 from typing import Optional
 from uuid import uuid4
@@ -48,6 +48,9 @@ TOOL_DEFINITIONS = [
     }
 ]
 
+# Serialized once; attached to every invoke_agent span
+TOOL_DEFINITIONS_JSON = json.dumps(TOOL_DEFINITIONS)
+
 # Model rotation for realistic traces
 MODELS = [
     "claude-opus-4.5", "claude-sonnet-4.5", "claude-haiku-4.5", "claude-sonnet-4", "claude-haiku",
@@ -165,6 +168,9 @@ def setup_telemetry(service_name: str, otlp_endpoint: str):
 otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
 tracer, meter = setup_telemetry("events-agent", otlp_endpoint)
 
+# Shared client so MCP calls reuse pooled keep-alive connections
+http_client = httpx.AsyncClient(timeout=30)
+
 inner_app = FastAPI(title="Events Agent", version="1.0.0")
 
 
@@ -202,7 +208,7 @@ async def get_events(request: EventsRequest):
             "gen_ai.agent.name": AGENT_NAME,
             "gen_ai.system": SYSTEMS[model],
             "gen_ai.request.model": model,
-            "gen_ai.tool.definitions": json.dumps(TOOL_DEFINITIONS),
+            "gen_ai.tool.definitions": TOOL_DEFINITIONS_JSON,
         },
     ) as span:
         destination = request.destination.lower()
@@ -217,7 +223,7 @@ async def get_events(request: EventsRequest):
             chat_span.set_attribute("gen_ai.usage.input_tokens", random.randint(100, 500))
             chat_span.set_attribute("gen_ai.usage.output_tokens", random.randint(50, 200))
             chat_span.set_attribute("gen_ai.response.finish_reasons", ["tool_calls"])
-            time.sleep(random.uniform(0.05, 0.15))
+            await asyncio.sleep(random.uniform(0.05, 0.15))
 
         # Check for fault injection
         if should_inject_fault(fault):
@@ -226,11 +232,11 @@ async def get_events(request: EventsRequest):
             if fault.type == "high_latency":
                 delay = fault.delay_ms / 1000.0
                 span.set_attribute("fault.delay_ms", fault.delay_ms)
-                time.sleep(delay)
+                await asyncio.sleep(delay)
 
             elif fault.type == "timeout":
                 span.set_status(Status(StatusCode.ERROR, "Tool execution timed out"))
-                time.sleep(30)
+                await asyncio.sleep(30)
                 return ErrorResponse(
                     error={"type": "timeout", "message": "Events lookup timed out"},
                     destination=request.destination,
@@ -287,7 +293,7 @@ async def get_events(request: EventsRequest):
                 "jsonrpc": "2.0", "method": "tools/call", "id": request_id,
                 "params": {"name": "fetch_events_api", "arguments": {"destination": destination}}
             }
-            resp = httpx.post(f"{MCP_SERVER_URL}/mcp", json=payload, headers=headers, timeout=30)
+            resp = await http_client.post(f"{MCP_SERVER_URL}/mcp", json=payload, headers=headers)
             mcp_result = resp.json().get("result", {})
             events_list = mcp_result.get("events", [])
             events = [Event(name=e["name"], type=e["type"], venue=e.get("venue", "TBD"), date=e.get("date", date)) for e in events_list]
@@ -4,9 +4,9 @@ MCP Server - Provides low-level tools via MCP protocol.
 Sub-agents call this server to execute actual tool logic.
 """
 
+import asyncio
 import os
 import random
-import time
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
@@ -97,7 +97,7 @@ async def handle_mcp(request: Request, body: ToolCallRequest):
             },
         ) as tool_span:
             try:
-                result = execute_tool(tool_name, arguments)
+                result = await execute_tool(tool_name, arguments)
                 return {"jsonrpc": "2.0", "id": request_id, "result": result}
             except Exception as e:
                 tool_span.set_status(Status(StatusCode.ERROR, str(e)))
@@ -105,33 +105,46 @@ async def handle_mcp(request: Request, body: ToolCallRequest):
                 return {"jsonrpc": "2.0", "id": request_id, "error": {"code": -32000, "message": str(e)}}
 
 
-def execute_tool(name: str, args: dict) -> dict:
+def fetch_weather_api(args: dict) -> dict:
+    """Return simulated current conditions for a location."""
+    location = args.get("location", "Unknown")
+    temp = random.randint(50, 90)
+    condition = random.choice(["sunny", "cloudy", "rainy", "partly cloudy"])
+    return {
+        "location": location,
+        "temperature": f"{temp}°F",
+        "condition": condition,
+        "humidity": f"{random.randint(30, 80)}%",
+        "wind_speed": f"{random.randint(0, 25)} mph",
+    }
+
+
+def fetch_events_api(args: dict) -> dict:
+    """Return a random subset of simulated events for a destination."""
+    destination = args.get("destination", "Unknown")
+    events = [
+        {"name": f"{destination} Food Festival", "date": "2025-03-15", "type": "food"},
+        {"name": f"{destination} Art Walk", "date": "2025-03-20", "type": "art"},
+        {"name": f"Live Music at {destination} Park", "date": "2025-03-22", "type": "music"},
+    ]
+    return {"destination": destination, "events": random.sample(events, k=random.randint(1, 3))}
+
+
+# Tool name -> implementation, keyed like TOOLS
+TOOL_HANDLERS = {
+    "fetch_weather_api": fetch_weather_api,
+    "fetch_events_api": fetch_events_api,
+}
+
+
+async def execute_tool(name: str, args: dict) -> dict:
     """Execute tool and return result."""
-    time.sleep(random.uniform(0.05, 0.15))  # Simulate API latency
-
-    if name == "fetch_weather_api":
-        location = args.get("location", "Unknown")
-        temp = random.randint(50, 90)
-        condition = random.choice(["sunny", "cloudy", "rainy", "partly cloudy"])
-        return {
-            "location": location,
-            "temperature": f"{temp}°F",
-            "condition": condition,
-            "humidity": f"{random.randint(30, 80)}%",
-            "wind_speed": f"{random.randint(0, 25)} mph",
-        }
-
-    elif name == "fetch_events_api":
-        destination = args.get("destination", "Unknown")
-        events = [
-            {"name": f"{destination} Food Festival", "date": "2025-03-15", "type": "food"},
-            {"name": f"{destination} Art Walk", "date": "2025-03-20", "type": "art"},
-            {"name": f"Live Music at {destination} Park", "date": "2025-03-22", "type": "music"},
-        ]
-        return {"destination": destination, "events": random.sample(events, k=random.randint(1, 3))}
-
-    else:
+    await asyncio.sleep(random.uniform(0.05, 0.15))  # Simulate API latency
+
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return handler(args)
 
 
 app = OpenTelemetryMiddleware(inner_app)
@@ -7,7 +7,6 @@ Supports fault injection at orchestrator level and pass-through to sub-agents.
 import asyncio
 import os
 import random
-import time
 import json
 from typing import Optional
 from uuid import uuid4
@@ -34,6 +33,12 @@ AGENT_NAME = "Travel Planner"
 WEATHER_AGENT_URL = os.getenv("WEATHER_AGENT_URL", "http://weather-agent:8000")
 EVENTS_AGENT_URL = os.getenv("EVENTS_AGENT_URL", "http://events-agent:8002")
 
+# Sub-agent fan-out timeout (seconds), overridden per orchestrator fault mode
+DEFAULT_FAN_OUT_TIMEOUT = 30.0
+ORCHESTRATOR_FAULT_TIMEOUTS = {
+    "fan_out_timeout": 0.001,
+}
+
 # Tool definitions for this agent
 TOOL_DEFINITIONS = [
     {
@@ -54,6 +59,9 @@ TOOL_DEFINITIONS = [
     }
 ]
 
+# Serialized once; attached to every invoke_agent span
+TOOL_DEFINITIONS_JSON = json.dumps(TOOL_DEFINITIONS)
+
 # Model rotation for realistic traces
 MODELS = [
     "claude-opus-4.5", "claude-sonnet-4.5", "claude-haiku-4.5", "claude-sonnet-4", "claude-haiku",
@@ -124,6 +132,9 @@ def setup_telemetry(service_name: str, otlp_endpoint: str):
 otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
 tracer, meter = setup_telemetry("travel-planner", otlp_endpoint)
 
+# Shared client so sub-agent calls reuse pooled keep-alive connections
+http_client = httpx.AsyncClient()
+
 
 inner_app = FastAPI(title="Travel Planner", version="1.0.0")
 
@@ -156,14 +167,11 @@ async def plan_trip(request: PlanRequest):
             "gen_ai.agent.name": AGENT_NAME,
             "gen_ai.system": SYSTEMS[model],
             "gen_ai.request.model": model,
-            "gen_ai.tool.definitions": json.dumps(TOOL_DEFINITIONS),
+            "gen_ai.tool.definitions": TOOL_DEFINITIONS_JSON,
             "destination": request.destination,
         },
     ) as span:
         fault = request.fault
-        errors = []
-        weather_data = None
-        events_data = []
 
         # Synthetic "thinking" LLM call
         with tracer.start_as_current_span("chat", kind=SpanKind.INTERNAL) as chat_span:
@@ -175,7 +183,7 @@ async def plan_trip(request: PlanRequest):
             chat_span.set_attribute("gen_ai.usage.input_tokens", input_tokens)
             chat_span.set_attribute("gen_ai.usage.output_tokens", output_tokens)
             chat_span.set_attribute("gen_ai.response.finish_reasons", ["tool_calls"])
-            time.sleep(random.uniform(0.1, 0.3))
+            await asyncio.sleep(random.uniform(0.1, 0.3))
 
         # Build sub-agent payloads with fault pass-through
         weather_payload = {"message": f"What's the weather in {request.destination}?"}
@@ -188,56 +196,17 @@ async def plan_trip(request: PlanRequest):
                 events_payload["fault"] = fault.events.model_dump()
 
         # Orchestrator-level fault injection
+        timeout = DEFAULT_FAN_OUT_TIMEOUT
         if fault and fault.orchestrator:
             span.set_attribute("fault.orchestrator", fault.orchestrator)
+            timeout = ORCHESTRATOR_FAULT_TIMEOUTS.get(fault.orchestrator, DEFAULT_FAN_OUT_TIMEOUT)
 
-            if fault.orchestrator == "fan_out_timeout":
-                timeout = 0.001
-            else:
-                timeout = 30.0
-        else:
-            timeout = 30.0
-
-        # Fan out to sub-agents
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            # Invoke weather agent
-            with tracer.start_as_current_span("invoke_agent weather-agent", kind=SpanKind.CLIENT) as agent_span:
-                agent_span.set_attribute("gen_ai.operation.name", "invoke_agent")
-                agent_span.set_attribute("gen_ai.agent.name", "weather-agent")
-                try:
-                    if fault and fault.orchestrator == "partial_failure" and random.random() < 0.5:
-                        raise Exception("Simulated partial failure - skipping weather")
-                    resp = await client.post(f"{WEATHER_AGENT_URL}/invoke", json=weather_payload)
-                    if resp.status_code == 200:
-                        weather_data = resp.json()
-                    else:
-                        errors.append({"agent": "weather", "error": resp.text})
-                        agent_span.set_status(Status(StatusCode.ERROR, resp.text))
-                except Exception as e:
-                    errors.append({"agent": "weather", "error": str(e)})
-                    agent_span.set_status(Status(StatusCode.ERROR, str(e)))
-
-            # Invoke events agent
-            with tracer.start_as_current_span("invoke_agent events-agent", kind=SpanKind.CLIENT) as agent_span:
-                agent_span.set_attribute("gen_ai.operation.name", "invoke_agent")
-                agent_span.set_attribute("gen_ai.agent.name", "events-agent")
-                try:
-                    if fault and fault.orchestrator == "partial_failure" and random.random() < 0.5:
-                        raise Exception("Simulated partial failure - skipping events")
-                    resp = await client.post(f"{EVENTS_AGENT_URL}/events", json=events_payload)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        if "error" not in data:
-                            events_data = data.get("events", [])
-                        else:
-                            errors.append({"agent": "events", "error": data["error"]})
-                            agent_span.set_status(Status(StatusCode.ERROR, str(data["error"])))
-                    else:
-                        errors.append({"agent": "events", "error": resp.text})
-                        agent_span.set_status(Status(StatusCode.ERROR, resp.text))
-                except Exception as e:
-                    errors.append({"agent": "events", "error": str(e)})
-                    tool_span.set_status(Status(StatusCode.ERROR, str(e)))
+        # Fan out to sub-agents concurrently
+        (weather_data, weather_error), (events_data, events_error) = await asyncio.gather(
+            invoke_weather_agent(weather_payload, fault, timeout),
+            invoke_events_agent(events_payload, fault, timeout),
+        )
+        errors = [err for err in (weather_error, events_error) if err]
 
         # Final response "chat" span
         with tracer.start_as_current_span("chat", kind=SpanKind.INTERNAL) as chat_span:
@@ -247,7 +216,7 @@ async def plan_trip(request: PlanRequest):
             chat_span.set_attribute("gen_ai.usage.input_tokens", random.randint(200, 800))
             chat_span.set_attribute("gen_ai.usage.output_tokens", random.randint(50, 200))
             chat_span.set_attribute("gen_ai.response.finish_reasons", ["stop"])
-            time.sleep(random.uniform(0.05, 0.15))
+            await asyncio.sleep(random.uniform(0.05, 0.15))
 
         # Build recommendation with graceful degradation
         partial = len(errors) > 0
@@ -275,6 +244,46 @@ async def plan_trip(request: PlanRequest):
         )
 
 
+async def invoke_weather_agent(payload: dict, fault: Optional[FaultConfig], timeout: float):
+    """Call the weather agent. Returns (weather_data, error)."""
+    with tracer.start_as_current_span("invoke_agent weather-agent", kind=SpanKind.CLIENT) as agent_span:
+        agent_span.set_attribute("gen_ai.operation.name", "invoke_agent")
+        agent_span.set_attribute("gen_ai.agent.name", "weather-agent")
+        try:
+            if fault and fault.orchestrator == "partial_failure" and random.random() < 0.5:
+                raise Exception("Simulated partial failure - skipping weather")
+            resp = await http_client.post(f"{WEATHER_AGENT_URL}/invoke", json=payload, timeout=timeout)
+            if resp.status_code == 200:
+                return resp.json(), None
+            agent_span.set_status(Status(StatusCode.ERROR, resp.text))
+            return None, {"agent": "weather", "error": resp.text}
+        except Exception as e:
+            agent_span.set_status(Status(StatusCode.ERROR, str(e)))
+            return None, {"agent": "weather", "error": str(e)}
+
+
+async def invoke_events_agent(payload: dict, fault: Optional[FaultConfig], timeout: float):
+    """Call the events agent. Returns (events, error)."""
+    with tracer.start_as_current_span("invoke_agent events-agent", kind=SpanKind.CLIENT) as agent_span:
+        agent_span.set_attribute("gen_ai.operation.name", "invoke_agent")
+        agent_span.set_attribute("gen_ai.agent.name", "events-agent")
+        try:
+            if fault and fault.orchestrator == "partial_failure" and random.random() < 0.5:
+                raise Exception("Simulated partial failure - skipping events")
+            resp = await http_client.post(f"{EVENTS_AGENT_URL}/events", json=payload, timeout=timeout)
+            if resp.status_code != 200:
+                agent_span.set_status(Status(StatusCode.ERROR, resp.text))
+                return [], {"agent": "events", "error": resp.text}
+            data = resp.json()
+            if "error" in data:
+                agent_span.set_status(Status(StatusCode.ERROR, str(data["error"])))
+                return [], {"agent": "events", "error": data["error"]}
+            return data.get("events", []), None
+        except Exception as e:
+            agent_span.set_status(Status(StatusCode.ERROR, str(e)))
+            return [], {"agent": "events", "error": str(e)}
+
+
 def build_recommendation(destination: str, weather: Optional[dict], events: list, partial: bool) -> str:
     parts = [f"Great choice! {destination} looks wonderful."]
 
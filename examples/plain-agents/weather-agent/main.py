@@ -22,10 +22,12 @@ References:
 """
 
 from dataclasses import dataclass
+import itertools
 import json
 import logging
 import os
 import random
+import re
 import time
 from typing import Dict, Any, List, Optional
 from uuid import uuid4
@@ -170,7 +172,7 @@ def get_weather(location: str) -> Dict[str, Any]:
         Weather data dictionary
     """
     # Simulate API latency
-    time.sleep(0.5)
+    time.sleep(random.uniform(0.4, 0.6))
     
     # Return mock weather data
     return {
@@ -184,7 +186,7 @@ def get_weather(location: str) -> Dict[str, Any]:
 
 def get_forecast(location: str, days: int = 3) -> Dict[str, Any]:
     """Get weather forecast for a location."""
-    time.sleep(0.5)
+    time.sleep(random.uniform(0.4, 0.6))
     forecasts = []
     conditions = ["sunny", "cloudy", "rainy", "partly cloudy"]
     for i in range(days):
@@ -199,7 +201,7 @@ def get_forecast(location: str, days: int = 3) -> Dict[str, Any]:
 
 def get_historical_weather(location: str, date: str) -> Dict[str, Any]:
     """Get historical weather for a location and date."""
-    time.sleep(0.5)
+    time.sleep(random.uniform(0.4, 0.6))
     return {
         "location": location,
         "date": date,
@@ -210,6 +212,30 @@ def get_historical_weather(location: str, date: str) -> Dict[str, Any]:
     }
 
 
+# Tools executed in-process (not via MCP), keyed by tool name
+LOCAL_TOOLS = {
+    "get_forecast": lambda args: get_forecast(args["location"], args.get("days", 3)),
+    "get_historical_weather": lambda args: get_historical_weather(args["location"], args.get("date", "2026-01-01")),
+}
+
+
+# wrong_tool fault: the tool called instead of the one the LLM selected
+WRONG_TOOLS = {
+    "get_current_weather": "get_forecast",
+    "get_forecast": "get_historical_weather",
+    "get_historical_weather": "get_current_weather",
+}
+
+
+# Query keywords used by the simulated LLM to pick a tool (substring match)
+FORECAST_KEYWORDS = re.compile(r"forecast|next|tomorrow|week|upcoming", re.IGNORECASE)
+HISTORICAL_KEYWORDS = re.compile(r"yesterday|last|historical|was|were|past", re.IGNORECASE)
+
+
+# Monotonic ids for simulated completions, unique within the process
+completion_ids = itertools.count(1)
+
+
 # Simulated LLM call
 def call_llm(
     model: str,
@@ -219,30 +245,31 @@ def call_llm(
     """
     Simulated LLM API call that selects appropriate tool based on query.
     """
-    time.sleep(1.0)
+    time.sleep(random.uniform(0.8, 1.2))
     
-    user_message = messages[-1]["content"].lower()
-    location = messages[-1]["content"].split()[-1].rstrip("?")
+    user_message = messages[-1]["content"]
+    location = user_message.split()[-1].rstrip("?")
     
     # Determine which tool to call based on query
-    if any(word in user_message for word in ["forecast", "next", "tomorrow", "week", "upcoming"]):
+    if FORECAST_KEYWORDS.search(user_message):
         tool_name = "get_forecast"
         arguments = {"location": location, "days": 3}
-    elif any(word in user_message for word in ["yesterday", "last", "historical", "was", "were", "past"]):
+    elif HISTORICAL_KEYWORDS.search(user_message):
         tool_name = "get_historical_weather"
         arguments = {"location": location, "date": "2026-01-25"}
     else:
         tool_name = "get_current_weather"
         arguments = {"location": location}
     
+    completion_id = next(completion_ids)
     return {
-        "id": "chatcmpl-123456",
+        "id": f"chatcmpl-{completion_id:06d}",
         "model": "gpt-4-0613",
         "choices": [{
             "message": {
                 "role": "assistant",
                 "tool_calls": [{
-                    "id": "call_abc123",
+                    "id": f"call_{completion_id:06d}",
                     "type": "function",
                     "function": {
                         "name": tool_name,
@@ -283,6 +310,9 @@ class WeatherAgent:
         self.agent_description = "Helps users get weather information for any location"
         self.model = random.choice(MODELS)  # Rotate model per instance
         
+        # Reuse pooled keep-alive connections for MCP tool calls
+        self.http_client = httpx.Client(timeout=30)
+        
         # Create metrics
         self.token_counter = meter.create_counter(
             name="gen_ai.client.token.usage",
@@ -343,6 +373,18 @@ class WeatherAgent:
                 }
             }
         ]
+        
+        # Tool name -> description, for execute_tool span attributes
+        self.tool_descriptions = {t["function"]["name"]: t["function"]["description"] for t in self.tools}
+        
+        # System instructions (separate from chat history per spec)
+        self.system_instructions = [
+            {"type": "text", "content": "You are a helpful weather assistant."}
+        ]
+        
+        # Static content-capture attributes, serialized once per agent
+        self.system_instructions_json = json.dumps(self.system_instructions)
+        self.tool_definitions_json = json.dumps(self.tools)
     
     def _should_inject_fault(self, fault: Optional[FaultConfig]) -> bool:
         """Check if fault should be injected based on probability."""
@@ -364,12 +406,7 @@ class WeatherAgent:
         Returns:
             Agent's response
         """
-        start_time = time.time()
-        
-        # System instructions (separate from chat history per spec)
-        system_instructions = [
-            {"type": "text", "content": "You are a helpful weather assistant."}
-        ]
+        start_time = time.perf_counter()
         
         # Create invoke_agent span with gen-ai semantic conventions
         with self.tracer.start_as_current_span(
@@ -398,8 +435,8 @@ class WeatherAgent:
                 
                 # Opt-in attributes (content capture)
                 # See schema definitions: https://github.com/open-telemetry/semantic-conventions/tree/e126ea9105b15912ccd80deab98929025189b696/docs/gen-ai
-                span.set_attribute("gen_ai.system_instructions", json.dumps(system_instructions))
-                span.set_attribute("gen_ai.tool.definitions", json.dumps(self.tools))
+                span.set_attribute("gen_ai.system_instructions", self.system_instructions_json)
+                span.set_attribute("gen_ai.tool.definitions", self.tool_definitions_json)
                 
                 # Structured logging with trace correlation
                 self.logger.info(
@@ -425,8 +462,12 @@ class WeatherAgent:
                 # Opt-in: Record input messages as attribute
                 span.set_attribute("gen_ai.input.messages", json.dumps(input_messages))
                 
+                # Sample the fault once so every injection point agrees for this request
+                if not self._should_inject_fault(fault):
+                    fault = None
+                
                 # Check for pre-LLM faults
-                if self._should_inject_fault(fault):
+                if fault:
                     if fault.delay_ms:
                         time.sleep(fault.delay_ms / 1000)
                     
@@ -450,7 +491,7 @@ class WeatherAgent:
                 
                 # Prepare messages for LLM call (internal format)
                 messages = [
-                    {"role": "system", "content": system_instructions[0]["content"]},
+                    {"role": "system", "content": self.system_instructions[0]["content"]},
                     {"role": "user", "content": user_message}
                 ]
                 
@@ -458,7 +499,7 @@ class WeatherAgent:
                 llm_response = call_llm(self.model, messages, self.tools)
                 
                 # Check for token_limit_exceeded fault (simulates truncated response)
-                if self._should_inject_fault(fault) and fault.type == "token_limit_exceeded":
+                if fault and fault.type == "token_limit_exceeded":
                     span.set_attribute("gen_ai.response.model", llm_response["model"])
                     span.set_attribute("gen_ai.response.id", llm_response["id"])
                     span.set_attribute("gen_ai.response.finish_reasons", ["length"])
@@ -511,9 +552,8 @@ class WeatherAgent:
                     tool_args = json.loads(tool_call["function"]["arguments"])
                     
                     # wrong_tool fault: swap the tool being called
-                    if self._should_inject_fault(fault) and fault.type == "wrong_tool":
-                        wrong_tools = {"get_current_weather": "get_forecast", "get_forecast": "get_historical_weather", "get_historical_weather": "get_current_weather"}
-                        tool_name = wrong_tools.get(tool_name, tool_name)
+                    if fault and fault.type == "wrong_tool":
+                        tool_name = WRONG_TOOLS.get(tool_name, tool_name)
                         # Adjust args for the wrong tool
                         if tool_name == "get_historical_weather":
                             tool_args["date"] = "2026-01-25"
@@ -558,7 +598,7 @@ class WeatherAgent:
                 )
                 
                 # Record operation duration
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 self.operation_duration.record(
                     duration,
                     attributes={
@@ -612,7 +652,7 @@ class WeatherAgent:
                 "jsonrpc": "2.0", "method": "tools/call", "id": request_id,
                 "params": {"name": tool_name, "arguments": arguments}
             }
-            resp = httpx.post(f"{MCP_SERVER_URL}/mcp", json=payload, headers=headers, timeout=30)
+            resp = self.http_client.post(f"{MCP_SERVER_URL}/mcp", json=payload, headers=headers)
             data = resp.json()
             if "error" in data:
                 raise ToolExecutionError(data["error"].get("message", "MCP tool error"))
@@ -624,6 +664,7 @@ class WeatherAgent:
         
         This method creates an execute_tool span following gen-ai semantic conventions.
         For weather tools, delegates to MCP server for actual execution.
+        The fault, if given, is applied as-is; invoke() has already sampled its probability.
         """
         # Create execute_tool span with gen-ai semantic conventions
         with self.tracer.start_as_current_span(
@@ -637,13 +678,13 @@ class WeatherAgent:
                 if tool_call_id:
                     span.set_attribute("gen_ai.tool.call.id", tool_call_id)
                 
-                tool_def = next((t for t in self.tools if t["function"]["name"] == tool_name), None)
-                if tool_def:
-                    span.set_attribute("gen_ai.tool.description", tool_def["function"]["description"])
+                tool_description = self.tool_descriptions.get(tool_name)
+                if tool_description:
+                    span.set_attribute("gen_ai.tool.description", tool_description)
                 span.set_attribute("gen_ai.tool.call.arguments", json.dumps(arguments))
                 
                 # Check for fault injection
-                if self._should_inject_fault(fault) and fault.type in ("tool_timeout", "tool_error", "high_latency"):
+                if fault and fault.type in ("tool_timeout", "tool_error", "high_latency"):
                     target_tool = fault.tool or tool_name
                     if target_tool == tool_name:
                         if fault.delay_ms:
@@ -661,18 +702,12 @@ class WeatherAgent:
                 session_id = uuid4().hex
                 if tool_name in ("get_current_weather", "get_weather"):
                     result = self._call_mcp_tool("fetch_weather_api", {"location": arguments["location"]}, session_id)
-                elif tool_name == "get_forecast":
-                    # Local tool - no MCP
-                    with self.tracer.start_as_current_span(f"local_tool {tool_name}", kind=trace.SpanKind.INTERNAL) as local_span:
-                        local_span.set_attribute("gen_ai.tool.name", tool_name)
-                        local_span.set_attribute("tool.source", "local")
-                        result = get_forecast(arguments["location"], arguments.get("days", 3))
-                elif tool_name == "get_historical_weather":
+                elif tool_name in LOCAL_TOOLS:
                     # Local tool - no MCP
                     with self.tracer.start_as_current_span(f"local_tool {tool_name}", kind=trace.SpanKind.INTERNAL) as local_span:
                         local_span.set_attribute("gen_ai.tool.name", tool_name)
                         local_span.set_attribute("tool.source", "local")
-                        result = get_historical_weather(arguments["location"], arguments.get("date", "2026-01-01"))
+                        result = LOCAL_TOOLS[tool_name](arguments)
                 else:
                     raise ValueError(f"Unknown tool: {tool_name}")
                 